@@ -18,7 +18,43 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from .main import Workbook, excel2df
-from .sheet import Sheet
-from .range import Range
-from .tools import number_to_date, date_to_number
+import importlib
+import os
+
+__all__ = ['Workbook', 'excel2df', 'excel_sheets_to_dfs', 'df2excel', 'read_many', 'Sheet', 'Range', 'number_to_date', 'date_to_number']
+
+# Public names are resolved from their submodules on first access (PEP 562), so importing
+# the package does not pull in pywin32 or pandas until they are actually needed.
+_lazy = {
+    'Workbook': '.main',
+    'excel2df': '.main',
+    'excel_sheets_to_dfs': '.main',
+    'df2excel': '.main',
+    'read_many': '.main',
+    'Sheet': '.sheet',
+    'Range': '.range',
+    'number_to_date': '.tools',
+    'date_to_number': '.tools',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
+
+
+# Tools that trace imports statically (e.g. PyInstaller) can set AUTOMATE_EXCEL_EAGER_IMPORT to
+# resolve every public name at import time instead.
+if os.environ.get('AUTOMATE_EXCEL_EAGER_IMPORT'):
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
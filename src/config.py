@@ -18,12 +18,42 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-xlDown = -4121
-xlToLeft = -4159
-xlToRight = -4161
-xlUp = -4162
+import enum
+import functools
+from collections import namedtuple
+from types import MappingProxyType
 
-supported_exts = [
+
+class XlDirection(enum.IntEnum):
+    """Directions accepted by Range.End in Microsoft Excel (the XlDirection enumeration)."""
+    DOWN = -4121
+    LEFT = -4159
+    RIGHT = -4161
+    UP = -4162
+
+
+xlDown = XlDirection.DOWN
+xlToLeft = XlDirection.LEFT
+xlToRight = XlDirection.RIGHT
+xlUp = XlDirection.UP
+
+xlCalculationManual = -4135
+xlNoKey = 0
+xlSheetVeryHidden = 2
+xlValidateNone = -4142
+
+# Writes to ranges with more cells than this suspend screen updating and recalculation (see fast_mode).
+fast_mode_cells = 10000
+
+# Writes to ranges with more cells than this are split into blocks of rows of at most this many cells.
+max_write_cells = 50000
+
+# Excel limits a data validation list typed into Formula1 to this many characters. Longer lists
+# are written to a hidden worksheet of this name and referenced from there instead.
+max_validation_formula = 255
+validation_list_sheet = 'automate_excel_lists'
+
+supported_exts = frozenset({
                     '.csv',
                     '.dbf',
                     '.dif',
@@ -48,9 +78,9 @@ supported_exts = [
                     '.xlw',
                     '.xml',
                     '.xps',
-                    ]
+                    })
 
-ext_save_codes = {
+ext_save_codes = MappingProxyType({
                     '.xla': 18,
                     '.csv': 6,
                     '.txt': -4158,
@@ -67,4 +97,34 @@ ext_save_codes = {
                     '.xlt': 17,
                     '.xls': -4143,
                     '.xml': 46,
-                    }
\ No newline at end of file
+                    })
+
+# Reverse of ext_save_codes. '.htm' and '.html' share code 44; '.html' is the canonical extension
+# because it comes later in ext_save_codes.
+save_code_to_ext = MappingProxyType({code: ext for ext, code in ext_save_codes.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def save_code(ext: str) -> int:
+    """Returns the Microsoft Excel file format code used to save a file with extension 'ext'.
+    The extension is matched case-insensitively, e.g. '.XLSX' and '.xlsx' give the same code.
+    Raises:
+        KeyError if there is no save code for the extension.
+    """
+    return ext_save_codes[ext.lower()]
+
+
+ExtInfo = namedtuple('ExtInfo', ('supported', 'save_code'))
+
+# Single lookup table for everything known about an extension, so validating a path and finding
+# its save code is one dict probe.
+EXT_INFO = MappingProxyType({ext: ExtInfo(True, ext_save_codes.get(ext)) for ext in supported_exts})
+
+_UNSUPPORTED = ExtInfo(False, None)
+
+
+def classify(ext: str) -> ExtInfo:
+    """Returns an ExtInfo(supported, save_code) for a file extension, matched case-insensitively.
+    save_code is None if Microsoft Excel can open but not save the file type (e.g. '.pdf').
+    """
+    return EXT_INFO.get(ext.lower(), _UNSUPPORTED)
@@ -0,0 +1,43 @@
+import enum
+import sys
+from typing import FrozenSet, Mapping, NamedTuple, Optional
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+class XlDirection(enum.IntEnum):
+    DOWN: int
+    LEFT: int
+    RIGHT: int
+    UP: int
+
+xlDown: Final[XlDirection]
+xlToLeft: Final[XlDirection]
+xlToRight: Final[XlDirection]
+xlUp: Final[XlDirection]
+
+xlCalculationManual: Final[int]
+xlNoKey: Final[int]
+xlSheetVeryHidden: Final[int]
+xlValidateNone: Final[int]
+
+fast_mode_cells: Final[int]
+max_write_cells: Final[int]
+max_validation_formula: Final[int]
+validation_list_sheet: Final[str]
+
+supported_exts: Final[FrozenSet[str]]
+ext_save_codes: Final[Mapping[str, int]]
+save_code_to_ext: Final[Mapping[int, str]]
+
+def save_code(ext: str) -> int: ...
+
+class ExtInfo(NamedTuple):
+    supported: bool
+    save_code: Optional[int]
+
+EXT_INFO: Final[Mapping[str, ExtInfo]]
+
+def classify(ext: str) -> ExtInfo: ...
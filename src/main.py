@@ -17,14 +17,16 @@
 
 import os
 import atexit
+import contextlib
+import functools
+import queue
+import threading
 
-import win32com.client
 import pywintypes
-import pandas as pd
 
 from src import config
 from src.sheet import Sheet
-from src.range import Range, ExcelError
+from src.range import Range, ExcelError, fast_mode, is_iter, _is_dataframe
 from src.sheet import get_extension
 
 
@@ -49,19 +51,28 @@ class Workbook():
         write_reserved_password: str or None, the password required to write
             changes to the file defined by filepath. Not necessary if the file is not
             password-protected or you do not intend to write to the file.
+        app: win32com.client.CDispatch or None, an already connected Microsoft Excel application
+            to open the workbook in. If None, the application shared by all such workbooks in the
+            current thread is used (connecting to Microsoft Excel first if needed), and it is quit
+            when python exits.
     """
+    # The application used by workbooks created without one, one per thread as COM requires.
+    _shared = threading.local()
+
     def __init__(self, filepath:str=None, visible:bool=False, save_on_close:bool=False,
                  quit_on_close:bool=False, display_alerts:bool=False, password:str or None=None,
-                 write_reserved_password:str or None=None):
+                 write_reserved_password:str or None=None, app=None):
         self.Workbook = None
+        # Values read from Microsoft Excel, dropped by the methods that change them (see _invalidate).
+        self._cached = {}
         self.open(validate_file_type(filepath),
                   visible,
                   save_on_close,
                   quit_on_close,
                   display_alerts,
                   password,
-                  write_reserved_password)
-        atexit.register(self.app.Application.Quit)
+                  write_reserved_password,
+                  app)
 
     def __enter__(self):
         return self
@@ -70,34 +81,40 @@ class Workbook():
         self.close()
 
     def __getitem__(self, item):
-        return Range(self.app, item)
+        return Range(self.app, item, workbook=self)
 
     def __setitem__(self, key, value):
-        Range(self.app, key).values = value
+        Range(self.app, key, workbook=self).values = value
 
     @property
     def path(self):
         """Returns the full path to the open workbook as a string."""
-        return os.path.join(self.workbook.Path, self.workbook.Name)
+        return self._get_cached('path', lambda: self.workbook.FullName)
 
     @property
     def dir(self):
         """Returns the path to the directory of the open workbook as a string."""
-        return self.workbook.Path
+        return self._get_cached('dir', lambda: self.workbook.Path)
 
     @property
     def name(self):
         """Returns the file name of the open workbook as a string."""
+        # Read live: the active workbook can change outside of this object.
         return self.app.ActiveWorkbook.Name
 
     @property
     def sheet_names(self):
-        """Returns a list of names of each worksheet in the open workbook."""
-        return [sheet.Name for sheet in self.app.Sheets]
+        """Returns a list of names of each worksheet in the open workbook.
+        The names are read from Microsoft Excel once and reused until the sheets are changed
+        through this object. The hidden sheet that holds long data validation lists (see
+        Range.data_validation_from_list) is not included.
+        """
+        return list(self._get_cached('sheet_names', self._read_sheet_names))
 
     @property
     def active_sheet(self):
         """Returns the name of the currently active worksheet as a string."""
+        # Read live: the active sheet can change outside of this object.
         return self._create_sheet()
 
     @active_sheet.setter
@@ -115,10 +132,11 @@ class Workbook():
         # pylint: disable=no-member
         except pywintypes.com_error as com_error:
             raise ExcelError(f"Could not open sheet '{name}'.") from com_error
+        self._invalidate('sheet_names')
 
     def open(self, filepath:str or None, visible:bool, save_on_close:bool,
              quit_on_close:bool, display_alerts:bool, password: str or None,
-             write_reserved_password:str or None):
+             write_reserved_password:str or None, app=None):
         """Opens a Microsoft Excel application.
         If a string is passed to the filepath argument the application will attempt to open that file.
         If the file does not exist a new file will be opened and saved to the provided filepath.
@@ -135,20 +153,21 @@ class Workbook():
             write_reserved_password: str or None, the password required to write changes to
                 the file defined by filepath. Not necessary if the file is not password-protected
                 or you do not intend to write to the file.
+            app: win32com.client.CDispatch or None, an already connected Microsoft Excel
+                application to use. If None, the shared application of the current thread is used.
         Returns:
             self
         Raises:
             ExcelError if a connection to the Microsoft Excel application could not be established.
             ExcelError if the file passed to filepath fails to open.
         """
-        try:
-            self.app = win32com.client.dynamic.Dispatch('Excel.Application')
-        # pylint: disable=no-member
-        except pywintypes.com_error as com_error:
-            raise ExcelError('Could not open Microsoft Excel Application.') from com_error
-        self.app.Visible = visible
-        self.app.Application.DisplayAlerts = display_alerts
-        self.app.AskToUpdateLinks = False
+        if app is None:
+            app = self._shared_app()
+        self.app = app
+        application = app.Application
+        application.Visible = visible
+        application.DisplayAlerts = display_alerts
+        application.AskToUpdateLinks = False
 
         self.save_on_close = save_on_close
         self.quit_on_close = quit_on_close
@@ -157,19 +176,29 @@ class Workbook():
             path = os.path.abspath(filepath)
             try:
                 # TODO: provide options for the inputs that are hardcoded in the Open() call
-                self.workbook = self.app.Application.Workbooks.Open(path, False, False,
-                                                                    None, password,
-                                                                    write_reserved_password)
+                self.workbook = application.Workbooks.Open(path, False, False,
+                                                           None, password,
+                                                           write_reserved_password)
             # pylint: disable=no-member
             except pywintypes.com_error as com_error:
                 raise ExcelError(f"Could not open file '{filepath}'.") from com_error
         else:
-            self.workbook = self.app.Application.Workbooks.Add()
+            self.workbook = application.Workbooks.Add()
             if filepath:
                 path = os.path.abspath(filepath)
                 self.save_as(path)
         return self
 
+    def fast_mode(self):
+        """Returns a context manager that suspends screen updating, events and automatic
+        recalculation in the application while many changes are made.
+        The previous settings are restored when the context exits.
+        Examples:
+            >>>with workbook.fast_mode():
+            >>>    workbook['A1:C1000'] = values
+        """
+        return fast_mode(self.app)
+
     def close(self):
         """Closes the current open workbook.
         If the save_on_close attribute is True, the workbook will be saved before closing.
@@ -178,12 +207,15 @@ class Workbook():
         of the application.
         """
         self.workbook.Close(self.save_on_close)
+        self.invalidate_cache()
         if self.quit_on_close:
             self.quit()
 
     def quit(self):
         """Closes the Excel application."""
-        self.app.Application.Quit()
+        if getattr(Workbook._shared, 'app', None) is self.app:
+            Workbook._shared.app = None
+        _quit_app(self.app)
 
     def sheet(self, name: str):
         """Returns a connection to a specific sheet.
@@ -201,13 +233,21 @@ class Workbook():
         return self._create_sheet(name)
 
     def sheet_exists(self, name: str):
-        """Checks if a worksheet exists in the open workbook.
+        """Checks if a sheet (worksheet or chart sheet) exists in the open workbook.
+        The name is looked up in sheet_names. Sheet names are not case-sensitive in Microsoft
+        Excel, so neither is this check.
         Arguments:
-            name: str, the name of the worksheet.
+            name: str, the name of the sheet.
         Returns:
             True if there is a sheet called 'name' in the open workbook, otherwise False.
+        Raises:
+            ExcelError if name is not a str.
         """
-        return name in self.sheet_names
+        if not isinstance(name, str):
+            raise ExcelError(f"Sheet names must be str, not {type(name).__name__}.")
+        name = name.lower()
+        return any(name == sheet_name.lower()
+                   for sheet_name in self._get_cached('sheet_names', self._read_sheet_names))
 
     def add_sheet(self, name:str, before:str or None=None, after:str or None=None):
         """Creates a new sheet in the open workbook.
@@ -223,18 +263,53 @@ class Workbook():
             ExcelError if a sheet with the given name already exists in the open workbook.
         """
         if not self.sheet_exists(name):
+            worksheets = self.app.Worksheets
             if before:
-                before = self.app.Worksheets(before)
+                before = worksheets(before)
             if after:
-                after = self.app.Worksheets(after)
+                after = worksheets(after)
             if not before and not after:
-                after = self.app.Worksheets(self.app.Worksheets.Count)
-            newsheet = self.app.Worksheets.Add(Before=before, After=after)
-            newsheet.Name = name
+                after = worksheets(worksheets.Count)
+            with self.fast_mode():
+                newsheet = worksheets.Add(Before=before, After=after)
+                newsheet.Name = name
+            self._invalidate('sheet_names')
         else:
             raise ExcelError(f"'{name}' is already a sheet in {self.name}.")
         return self._create_sheet(name)
 
+    def add_sheets(self, names: list):
+        """Creates several new sheets behind all existing sheets in the open workbook.
+        The sheets are created with a single COM call and then named, with screen updating and
+        recalculation suspended, which is much faster than calling add_sheet for each name.
+        Arguments:
+            names: list of str, the names to give the new worksheets, in order.
+        Returns:
+            A list of Sheet objects connected to the new worksheets.
+        Raises:
+            ExcelError if a name is not a str, is repeated or is already a sheet in the open
+            workbook.
+        """
+        names = list(names)
+        if not names:
+            return []
+        for name in names:
+            if not isinstance(name, str):
+                raise ExcelError(f"Sheet names must be str, not {type(name).__name__}.")
+        if len({name.lower() for name in names}) != len(names):
+            raise ExcelError('The names passed to add_sheets must be unique.')
+        for name in names:
+            if self.sheet_exists(name):
+                raise ExcelError(f"'{name}' is already a sheet in {self.name}.")
+        with self.fast_mode():
+            worksheets = self.app.Worksheets
+            count = worksheets.Count
+            worksheets.Add(After=worksheets(count), Count=len(names))
+            for index, name in enumerate(names, start=count + 1):
+                worksheets(index).Name = name
+        self._invalidate('sheet_names')
+        return [self._create_sheet(name) for name in names]
+
     def save(self):
         """Saves the open workbook.
         Raises:
@@ -267,7 +342,10 @@ class Workbook():
         ext = get_extension(filepath)
         if ext is not None:
             validate_file_type(filepath)
-            code = config.ext_save_codes[ext]
+            try:
+                code = config.save_code(ext)
+            except KeyError as key_error:
+                raise ExcelError(f"Workbooks can not be saved as {ext} files.") from key_error
         else:
             code = self.app.DefaultSaveFormat
         try:
@@ -277,6 +355,7 @@ class Workbook():
         except Exception as excel_error:
             raise ExcelError(f"Could not save workbook '{self.name}' as '{filepath}.' \n"
                              f"Check that the destination path is correctly formatted.") from excel_error
+        self._invalidate('path', 'dir')
 
     def save_copy_as(self, filepath: str):
         """Saves a copy of the open workbook as a new file.
@@ -287,9 +366,8 @@ class Workbook():
         Raises:
             ExcelError if the file can not be saved.
         """
-        ext = get_extension(filepath)
-        if ext is not None:
-            validate_file_type(ext)
+        if get_extension(filepath) is not None:
+            validate_file_type(filepath)
         else:
             raise ExcelError('Saving as a copy requires the path to include a file extension.')
         try:
@@ -310,15 +388,15 @@ class Workbook():
 
     def refresh_pivots(self):
         """Refreshes all pivot tables in the workbook.
+        Screen updating and recalculation are suspended until every pivot table is refreshed.
         """
-        sheets = len([sheet.Name for sheet in self.app.Sheets])
-        for sheet in range(sheets):
-            worksheet = self.workbook.Worksheets[sheet]
-            worksheet.Unprotect()  # if protected
-
-            pivotCount = worksheet.PivotTables().Count
-            for i in range(1, pivotCount + 1):
-                worksheet.PivotTables(i).PivotCache().Refresh()
+        with self.fast_mode():
+            for worksheet in self.workbook.Worksheets:
+                if _is_validation_list_sheet(worksheet.Name):
+                    continue
+                worksheet.Unprotect()  # if protected
+                for pivot_table in worksheet.PivotTables():
+                    pivot_table.PivotCache().Refresh()
 
     def run_macro(self, name: str):
         """Runs a macro of the open workbook.
@@ -331,10 +409,122 @@ class Workbook():
             self.app.Application.Run(name)
         except Exception as excel_error:
             raise ExcelError(f"Could not run macro '{name}' in workbook '{self.name}'.") from excel_error
+        finally:
+            # The macro may have changed the sheets or the workbook itself.
+            self.invalidate_cache()
+
+    def write_block(self, top_left, matrix):
+        """Writes a 2-D block of values to the active sheet in one COM call, or in blocks of rows
+        if it has more than config.max_write_cells cells.
+        The block is sized to fit matrix, so the full extent of the target range does not need
+        to be known in advance. Writing a block at once is much faster than writing cell by cell.
+        Arguments:
+            top_left: str or tuple, the top-left cell of the block in Microsoft Excel syntax
+                (e.g. 'B2') or as a (row, column) tuple.
+            matrix: an iterable of rows, each an iterable of values, or a pandas DataFrame (whose
+                values are written without the column names or index). Rows shorter than the
+                longest row are padded with None.
+        Returns:
+            A Range object referring to the block that was written.
+        Raises:
+            ExcelError if top_left is not a valid cell reference, matrix contains no values or
+            a row of matrix is not a sequence of values (e.g. a string).
+        """
+        if _is_dataframe(matrix):
+            matrix = matrix.to_numpy(dtype=object)
+        rows = []
+        for row in matrix:
+            if isinstance(row, (str, bytes)) or not is_iter(row):
+                raise ExcelError(f'Each row of matrix must be a sequence of values, not {row!r}.')
+            rows.append(tuple(row))
+        matrix = tuple(rows)
+        width = max(map(len, matrix), default=0)
+        if not width:
+            raise ExcelError('No values to write.')
+        if isinstance(top_left, tuple):
+            row, column = top_left
+        else:
+            try:
+                start = self.app.Range(top_left)
+            # pylint: disable=no-member
+            except pywintypes.com_error as com_error:
+                raise ExcelError(f"Could not find range '{top_left}'") from com_error
+            row, column = start.Row, start.Column
+        block = Range(self.app, ((row, column),
+                                 (row + len(matrix) - 1, column + width - 1)),
+                      workbook=self)
+        block.values = matrix
+        return block
+
+    def read_block(self, range):
+        """Reads the values of a range in a single COM call.
+        Arguments:
+            range: the cell reference in Microsoft Excel syntax or as a tuple (see Range).
+        Returns:
+            A 2-D numpy array (dtype object) of the values in the range.
+        """
+        import numpy as np
+
+        return np.array(Range(self.app, range, workbook=self).values, dtype=object, ndmin=2)
+
+    def invalidate_sheet_names(self):
+        """Discards the cached sheet names so that sheet_names is read from Microsoft Excel again.
+        Call this after changing the sheets of the workbook outside of this object, e.g. through
+        the app attribute.
+        """
+        self._invalidate('sheet_names')
+
+    def invalidate_cache(self):
+        """Discards every value cached from Microsoft Excel (path, dir and sheet_names) so that
+        each is read again. Call this after changing the workbook outside
+        of this object, e.g. through the app attribute.
+        """
+        self._cached.clear()
+
+    def _read_sheet_names(self):
+        """Reads the names of the sheets of the open workbook, leaving out the validation list sheet."""
+        names = [sheet.Name for sheet in self.app.Sheets]
+        return [name for name in names if not _is_validation_list_sheet(name)]
+
+    def _get_cached(self, key: str, read):
+        """Returns the cached value for key, calling read to fetch it from Microsoft Excel if needed."""
+        try:
+            return self._cached[key]
+        except KeyError:
+            value = self._cached[key] = read()
+            return value
+
+    def _invalidate(self, *keys: str):
+        """Discards the cached values for the given keys."""
+        for key in keys:
+            self._cached.pop(key, None)
 
     def autofit(self):
         self.workbook.ActiveSheet.Columns.AutoFit()
 
+    @classmethod
+    def _shared_app(cls):
+        """Returns the shared application of the current thread, connecting to Microsoft Excel
+        if there is none yet or it is no longer running.
+        Raises:
+            ExcelError if a connection to the Microsoft Excel application could not be established.
+        """
+        app = getattr(cls._shared, 'app', None)
+        if app is not None:
+            try:
+                app.Workbooks.Count
+                return app
+            # pylint: disable=no-member
+            except pywintypes.com_error:
+                pass
+        try:
+            app = dispatch_excel()
+        # pylint: disable=no-member
+        except (pywintypes.com_error, AttributeError) as com_error:
+            raise ExcelError('Could not open Microsoft Excel Application.') from com_error
+        cls._shared.app = _register_app(app)
+        return app
+
     def _create_sheet(self, name: str=None):
         """Creates a sheet object based on current Excel workbook and (optionally) provided name.
 
@@ -344,30 +534,328 @@ class Workbook():
             A sheet object from the current Workbook.
         """
         if name:
-            return Sheet(self.app.Worksheets(name), self.path)
+            return Sheet(self.app.Worksheets(name), self.path, workbook=self)
         else:
-            return Sheet(self.app.ActiveSheet, self.path)
+            return Sheet(self.app.ActiveSheet, self.path, workbook=self)
+
+
+class _ExcelAppPool():
+    """A pool of Microsoft Excel applications that are reused rather than started for every file.
+    Starting Excel takes seconds, so functions that open many files one after another borrow an
+    application from the pool instead of dispatching their own.
+    COM objects can only be used from the thread that created them, so each thread has its own
+    pool. Threads other than the main thread must call pythoncom.CoInitialize() before use.
+    Arguments:
+        max_apps: int, the number of idle applications kept per thread. An application released
+            into a full pool is quit.
+    """
+    def __init__(self, max_apps: int=2):
+        self.max_apps = max_apps
+        self._local = threading.local()
+        # The idle queues of every thread, so that clear can reach all of them.
+        self._queues = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """Yields an idle application from the pool, starting a new one if none are idle.
+        The application is returned to the pool when the context exits.
+        """
+        try:
+            app = self._idle().get_nowait()
+        except queue.Empty:
+            app = _register_app(dispatch_excel(new_instance=True))
+        try:
+            yield app
+        finally:
+            self.release(app)
+
+    def release(self, app):
+        """Returns an application to the pool, quitting it if the pool is full."""
+        try:
+            self._idle().put_nowait(app)
+        except queue.Full:
+            _quit_app(app)
+
+    def clear(self):
+        """Quits every idle application in the pool, including those pooled by other threads."""
+        with self._lock:
+            queues = list(self._queues)
+        for idle in queues:
+            while True:
+                try:
+                    app = idle.get_nowait()
+                except queue.Empty:
+                    break
+                _quit_app(app)
+
+    def _idle(self):
+        """Returns the queue of idle applications belonging to the current thread."""
+        try:
+            return self._local.idle
+        except AttributeError:
+            idle = self._local.idle = queue.LifoQueue(maxsize=self.max_apps)
+            with self._lock:
+                self._queues.append(idle)
+            return idle
+
+
+_app_pool = _ExcelAppPool()
+
+# Every application connected to by this module and not quit yet, from any thread, keyed by id.
+# Each is kept with a stream marshalling it for use from other threads, as a COM object can only
+# be called from the thread that created it and python may exit from a different one.
+_started_apps = {}
+_started_apps_lock = threading.Lock()
+
+
+def _register_app(app):
+    """Records an application so that it is quit when python exits. Returns app."""
+    import pythoncom
+
+    stream = pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, app._oleobj_)
+    with _started_apps_lock:
+        _started_apps[id(app)] = (app, stream)
+    return app
+
+
+def _quit_app(app):
+    """Quits an application from any thread, removing it from the registry of started applications."""
+    with _started_apps_lock:
+        entry = _started_apps.pop(id(app), None)
+    if entry is None:
+        app.Application.Quit()
+    else:
+        _quit_marshalled(entry[1])
+
+
+def _quit_marshalled(stream):
+    """Quits the application marshalled in stream, ignoring applications that are no longer running."""
+    import pythoncom
+    import win32com.client
+
+    try:
+        dispatch = pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch)
+        win32com.client.Dispatch(dispatch).Quit()
+    # pylint: disable=no-member
+    except pywintypes.com_error:
+        pass
+
+
+@atexit.register
+def _quit_started_apps():
+    """Quits every registered application that is still running when python exits, whichever
+    thread started it."""
+    _app_pool.clear()
+    with _started_apps_lock:
+        entries = list(_started_apps.values())
+        _started_apps.clear()
+    for _, stream in entries:
+        _quit_marshalled(stream)
+
+
+# The CLSID, LCID and version (major, minor) of the Microsoft Excel object library.
+_EXCEL_TYPELIB = ('{00020813-0000-0000-C000-000000000046}', 0, 1, 9)
+
+
+def dispatch_excel(new_instance: bool=False):
+    """Connects to a Microsoft Excel application using early-bound COM wrappers.
+    Early binding (via the makepy cache) resolves member IDs once, so attribute and method access
+    on the application and its objects avoids a name lookup round trip per call.
+    If the generated wrappers are stale (a known pywin32 issue that surfaces as an AttributeError,
+    e.g. on CLSIDToClassMap), the cache is cleared and the connection is retried once.
+    Arguments:
+        new_instance: bool, if True a new Microsoft Excel process is always started. Otherwise
+            a running instance of Microsoft Excel may be connected to.
+    Returns:
+        The connected Microsoft Excel application.
+    """
+    import win32com.client
+
+    if new_instance:
+        target = win32com.client.DispatchEx('Excel.Application')._oleobj_
+    else:
+        target = 'Excel.Application'
+    try:
+        return win32com.client.gencache.EnsureDispatch(target)
+    except AttributeError:
+        _clear_gen_py_cache()
+        return win32com.client.gencache.EnsureDispatch(target)
+
+
+def _ensure_excel_wrappers():
+    """Generates the early-bound wrappers for the Microsoft Excel type library, without starting
+    or connecting to Excel. A stale cache is cleared and the wrappers generated again, as in
+    dispatch_excel.
+    """
+    import win32com.client
+
+    try:
+        win32com.client.gencache.EnsureModule(*_EXCEL_TYPELIB)
+    except AttributeError:
+        _clear_gen_py_cache()
+        win32com.client.gencache.EnsureModule(*_EXCEL_TYPELIB)
+
+
+def _clear_gen_py_cache():
+    """Removes the wrappers generated by win32com so that they are rebuilt on next use."""
+    import shutil
+    import sys
+    import win32com.client
+
+    for module in [name for name in sys.modules if name.startswith('win32com.gen_py.')]:
+        del sys.modules[module]
+    shutil.rmtree(win32com.client.gencache.GetGeneratePath(), ignore_errors=True)
 
 
 def excel2df(filepath: str, sheet_name: str):
     """Creates a dataframe based on a provided excel sheet.
+    The values of the sheet's used range are read in a single COM call, with the first row used
+    as column names.
     Arguments:
         filepath: str, the path to the excel file
-        sheet_name: str, the specific sheet name to be converted
+        sheet_name: str, the specific sheet name to be converted. If None the active sheet is used.
     Returns:
         A dataframe based on the sheet specified.
+    Raises:
+        ExcelError if sheet_name is not a sheet in the workbook.
         """
-    with Workbook(filepath) as excel:
-        temp_path = 'C:\\Windows\\Temp\\tmpExcel.csv'
-        excel.app.Application.DisplayAlerts = False
-        if sheet_name:
-            excel.active_sheet = sheet_name
-        excel.save_as(temp_path)
-    dataframe = pd.read_csv(temp_path)
-    os.unlink(temp_path)
+    return excel_sheets_to_dfs(filepath, [sheet_name])[sheet_name]
+
+
+def excel_sheets_to_dfs(filepath: str, sheet_names: list) -> dict:
+    """Creates a dataframe for each of several sheets of an excel file.
+    The file is opened once and each sheet is read as in excel2df, which is much faster than
+    calling excel2df for every sheet.
+    Arguments:
+        filepath: str, the path to the excel file
+        sheet_names: list of str, the sheets to be converted. None refers to the active sheet.
+    Returns:
+        A dict mapping each sheet name to a dataframe based on that sheet.
+    Raises:
+        ExcelError if one of sheet_names is not a sheet in the workbook.
+    """
+    dataframes = {}
+    with _app_pool.acquire() as app, Workbook(filepath, app=app) as excel, excel.fast_mode():
+        for sheet_name in sheet_names:
+            dataframes[sheet_name] = _sheet_to_dataframe(excel, sheet_name)
+    return dataframes
+
+
+def read_many(filepaths: list, sheet_name: str=None, workers: int=4) -> list:
+    """Creates a dataframe from the same sheet of each of several excel files, in parallel.
+    The files are shared between worker threads, each with its own Microsoft Excel process,
+    so that files are opened simultaneously and the time spent starting Excel overlaps.
+    Arguments:
+        filepaths: list of str, the paths to the excel files.
+        sheet_name: str or None, the sheet to be converted in every file. If None the active
+            sheet of each file is used.
+        workers: int, the number of worker threads (and so Excel processes) to use.
+    Returns:
+        A list of dataframes in the same order as filepaths.
+    Raises:
+        ExcelError if sheet_name is not a sheet in one of the files.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    filepaths = list(filepaths)
+    if not filepaths:
+        return []
+    # Generates (or repairs) the early-bound wrappers once, on this thread, so that the workers
+    # never run makepy or clear its cache at the same time as each other.
+    _ensure_excel_wrappers()
+    workers = max(1, min(workers, len(filepaths)))
+    batches = [filepaths[i::workers] for i in range(workers)]
+    dataframes = [None] * len(filepaths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(functools.partial(_read_batch, sheet_name=sheet_name), batches)
+        for i, batch in enumerate(results):
+            dataframes[i::workers] = batch
+    return dataframes
+
+
+def _read_batch(filepaths: list, sheet_name: str or None) -> list:
+    """Reads a sheet of each file into a dataframe in a new Microsoft Excel process.
+    This runs in a worker thread of read_many, so it initialises COM for the thread and quits
+    the Excel process it started before returning. read_many has already generated the wrappers,
+    so DispatchEx returns an early-bound application without touching the makepy cache.
+    """
+    import pythoncom
+    import win32com.client
+
+    pythoncom.CoInitialize()
+    try:
+        app = win32com.client.DispatchEx('Excel.Application')
+        try:
+            dataframes = []
+            for filepath in filepaths:
+                with Workbook(filepath, app=app) as excel:
+                    dataframes.append(_sheet_to_dataframe(excel, sheet_name))
+            return dataframes
+        finally:
+            app.Application.Quit()
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def _sheet_to_dataframe(excel: Workbook, sheet_name: str or None):
+    """Creates a dataframe from the used range of a sheet of an open workbook."""
+    if sheet_name:
+        worksheet = excel.sheet(sheet_name).sheet
+    else:
+        worksheet = excel.app.ActiveSheet
+    return _values_to_dataframe(worksheet.UsedRange.Value2)
+
+
+def df2excel(dataframe, filepath: str, sheet_name: str='Sheet1', index: bool=False):
+    """Writes a dataframe to a new .xlsx file without starting Microsoft Excel.
+    The file is written directly by the xlsxwriter package (install automate_excel[xlsxwriter]),
+    which is far faster than writing the values into a workbook over COM. Use a Workbook instead
+    when the file already exists or Excel features such as formulas or macros are needed.
+    Arguments:
+        dataframe: pandas.DataFrame, the values to write. The column names are written as the
+            first row.
+        filepath: str, the path to the new file. Any existing file is overwritten.
+        sheet_name: str, the name of the worksheet to write to.
+        index: bool, if True the index of the dataframe is written as the first column.
+    Raises:
+        ExcelError if filepath is not an .xlsx file.
+    """
+    import pandas as pd
+
+    if (get_extension(filepath) or '').lower() != '.xlsx':
+        raise ExcelError(f"df2excel can only write .xlsx files, not '{filepath}'.")
+    with pd.ExcelWriter(filepath, engine='xlsxwriter') as writer:
+        dataframe.to_excel(writer, sheet_name=sheet_name, index=index)
+
+
+def _values_to_dataframe(values):
+    """Creates a dataframe from the Value2 of a range, using the first row as column names."""
+    import pandas as pd
+
+    if not isinstance(values, tuple):
+        values = ((values,),)
+    dataframe = pd.DataFrame.from_records(values[1:], columns=values[0])
+    # Value2 returns every number as a float, so infer int columns the way pandas.read_csv does.
+    columns = [_infer_int(dataframe.iloc[:, position]) for position in range(dataframe.shape[1])]
+    if any(column.dtype.kind == 'i' for column in columns):
+        dataframe = pd.concat(columns, axis=1)
     return dataframe
 
 
+def _infer_int(column):
+    """Returns column as int64 if it is a float column holding only whole numbers."""
+    if column.dtype.kind == 'f' and column.notna().all() and (column % 1 == 0).all() \
+            and (column.abs() < 2 ** 63).all():
+        return column.astype('int64')
+    return column
+
+
+def _is_validation_list_sheet(name: str) -> bool:
+    """Returns True if name is the hidden sheet that holds long data validation lists."""
+    return name.lower() == config.validation_list_sheet.lower()
+
+
 def validate_file_type(filepath: str) -> str:
     """Checks if a file is a type that is supported by Microsoft Excel.
 
@@ -384,7 +872,7 @@ def validate_file_type(filepath: str) -> str:
     """
     ext = get_extension(filepath)
     if ext is not None:
-        if not ext in config.supported_exts:
+        if not config.classify(ext).supported:
             raise ExcelError(f"Filetype {ext} is not a supported format for Microsoft Excel.")
     return filepath
 
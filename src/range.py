@@ -1,18 +1,34 @@
-import re
+import contextlib
+import functools
+import sys
 from typing import Union, Tuple, Any
 
-import numpy as np
-import pandas as pd
+import pythoncom
 import pywintypes
 import win32com.client
 
 from src import config
+from src import tools
+from src.config import xlDown, xlToLeft, xlToRight
+
+# The Range method used by Range.clear for each kind of clear.
+_CLEAR_METHODS = {
+    'all': 'clear_all',
+    'values': 'clear_values',
+    'formatting': 'clear_formatting',
+    'contents': 'clear_contents',
+    'comments': 'clear_comments',
+}
+
+# DISPIDs of the Range properties read through _get_property, looked up once per process.
+_dispids = {}
 
 
 class Range():
     """An object representing a range of cells in a Microsoft Excel workbook.
     Attributes:
         app: the Microsoft Excel application that the workbook the range belongs to is open in.
+        workbook: the Workbook instance the range was created from, or None.
         sheet: the win32com.client.CDispatch object referring to the worksheet that
             this cell range is on.
         dim: tuple, the number of columns, rows in this range.
@@ -30,6 +46,8 @@ class Range():
         application: win32com.client.CDispatch, the Microsoft Excel application that the workbook
             the range belongs to is open in.
         range: str, the cell reference in Microsoft Excel syntax.
+        workbook: Workbook or None, the Workbook instance the range was created from. Its cached
+            values are invalidated when the range changes the sheets of the workbook.
     Examples:
         The range can be referenced as a string or as a number combination. In the following example, cell 'A5' is
         equivalent to tuple (1, 5):
@@ -41,53 +59,66 @@ class Range():
             >>>spreadsheet[(1, 1), (5, 1)]
     """
     def __init__(self, application: win32com.client.CDispatch,
-                 range: Union[str, Tuple[int, int], Tuple[Tuple[int, int], Tuple[int, int]]]):
+                 range: Union[str, Tuple[int, int], Tuple[Tuple[int, int], Tuple[int, int]]],
+                 workbook=None):
         self.app = application
+        self.workbook = workbook
+        # Cell coordinates are converted to an address in Python (cached), so that any range
+        # costs a single COM call rather than one per corner cell.
+        address = tools.cells_to_address(range) if isinstance(range, tuple) else range
+        if address is None:
+            raise ExcelError(f'Could not find range "{range}"')
         try:
-            if isinstance(range, tuple):
-                if isinstance(range[0], tuple):
-                    self._range = application.Range(application.Cells(range[0][0], range[0][1]),
-                                                    application.Cells(range[1][0], range[1][1]))
-                else:
-                    self._range = application.Cells(range[0], range[1])
-            else:
-                self._range = application.Range(range)
+            com_range = application.Range(address)
         # pylint: disable=no-member
         except pywintypes.com_error as com_error:
-            raise ExcelError('Could not find range "' + range + '"') from com_error
+            raise ExcelError(f'Could not find range "{range}"') from com_error
+        self._set_range(com_range)
 
     def __len__(self):
-        list_of_values = [element for tupl in self._range for element in tupl]
-        return len(list_of_values)
+        # Count covers every area of a multi-area range, unlike Rows.Count * Columns.Count.
+        return self._range.Count
 
     def __eq__(self, other):
-        return self.address == other.address and self.sheet == other.sheet and self.app == other.app
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self._reference() == other._reference() and self.app == other.app
 
     @property
     def sheet(self):
         """Returns the win32com.client.CDispatch object referring to the worksheet
         that this cell range is on"""
-        return self._range.Worksheet
+        if self._sheet is None:
+            self._sheet = self._range.Worksheet
+        return self._sheet
 
     @property
     def dim(self):
         """Returns the number of columns, rows in this range as a tuple"""
-        return self._range.Columns.Count, self._range.Rows.Count
+        return self.columns, self.rows
 
     @property
     def rows(self):
         """Returns the amount of rows in the range"""
-        return self._range.Rows.Count
+        if self._rows is None and self._address is None:
+            self._fetch_bundle()
+        if self._rows is None:
+            self._rows = self._range.Rows.Count
+        return self._rows
 
     @property
     def columns(self):
         """Returns the amount of columns in the range"""
-        return self._range.Columns.Count
+        if self._columns is None and self._address is None:
+            self._fetch_bundle()
+        if self._columns is None:
+            self._columns = self._range.Columns.Count
+        return self._columns
 
     @property
     def values(self):
         """Returns the values of the cells in the range"""
-        return self._range.Value2
+        return _get_property(self._range, 'Value2')
 
     @property
     def name(self):
@@ -101,32 +132,41 @@ class Range():
     @property
     def start_cell(self):
         """Returns the first cell in the range"""
-        return self.address.split(':')[0]
+        # Taken from the cached address; the first area of a multi-area range holds the first cell.
+        return self.address.split(',', 1)[0].split(':', 1)[0]
 
     @property
     def address(self):
         """Returns the definition of the range (without $)"""
-        return re.sub('\$','', self._range.Address)
+        if self._address is None:
+            self._fetch_bundle()
+        return self._address
 
     @property
     def number_format(self):
         """Returns code denoting the formatting rules for numbers in this cell."""
-        return self._range.NumberFormat
+        return _get_property(self._range, 'NumberFormat')
 
     @property
     def has_data_validation(self):
-        """Returns a bool dependant on whether the range has data validation."""
+        """Returns a bool dependant on whether the range has data validation.
+        This is read from Excel each time, as validation can be changed through other ranges over
+        the same cells.
+        """
+        # Excel usually raises rather than reporting xlValidateNone for a range without
+        # validation, so both are treated as having none.
         try:
-            type = self._range.Validation.Type
-            return True
-        except:
+            return self._range.Validation.Type != config.xlValidateNone
+        # pylint: disable=no-member
+        except pywintypes.com_error:
             return False
 
     @property
     def comment(self):
         """Returns the comment (if any) attached to the first cell in the range."""
-        if self._range.Cells(1).Comment:
-            return self._range.Cells(1).Comment.Text()
+        comment = self._range.Cells(1).Comment
+        if comment:
+            return comment.Text()
         return None
 
     @comment.setter
@@ -155,16 +195,33 @@ class Range():
             Or an iterable (which can contain other iterables to form a matrix-like data structure), for example:
                 >>>spreadsheet['A1:B2'].values = (('a', 'b'), ('c', 'd'))
             Or a pandas DataFrame. If a DataFrame is passed the column names and index will not be inserted, only the
-            values of the DataFrame will be used.
+            values of the DataFrame will be used, and the range is resized to the shape of the DataFrame starting
+            from its first cell.
         """
-        if isinstance(values, pd.core.frame.DataFrame):
-            values = tuple(map(tuple, values.values))
-            row_offset = len(values)
-            column_offset = max([len(v) if is_iter(v) else 1 for v in values])
-            end_cell = self.app.Range(self.start_cell).GetOffset(row_offset, column_offset).Address.replace('$', '')
-            self._range = self.app.Range(':'.join([self.start_cell, end_cell]))
-        values = format_values(values, self.rows, self.columns)
-        self._range.Value2 = values
+        if _is_dataframe(values):
+            values = values.to_numpy(dtype=object)
+            rows, columns = values.shape
+            start = self._range.Cells(1)
+            # The range is resized to exactly the shape of the DataFrame, from its first cell.
+            self._set_range(self.sheet.Range(start, start.GetOffset(max(rows - 1, 0), max(columns - 1, 0))))
+        rows, columns = self.rows, self.columns
+        # Array input is passed to Excel as an explicitly typed SAFEARRAY of VARIANTs.
+        wrap = _variant_array if _is_ndarray(values) else _unchanged
+        values = format_values(values, rows, columns)
+        if rows * columns > config.fast_mode_cells:
+            suspend = fast_mode(self.app)
+        else:
+            suspend = contextlib.nullcontext()
+        with suspend:
+            if rows * columns <= config.max_write_cells:
+                self._range.Value2 = wrap(values)
+            else:
+                # Very large arrays can exhaust Excel's resources, so write them in blocks of rows.
+                step = max(1, config.max_write_cells // columns)
+                cells = self._range.Cells
+                for top in range(0, rows, step):
+                    bottom = min(top + step, rows)
+                    self.sheet.Range(cells(top + 1, 1), cells(bottom, columns)).Value2 = wrap(values[top:bottom])
 
     @name.setter
     def name(self, name: str):
@@ -193,27 +250,17 @@ class Range():
             The table selection is done by referencing the starting cell as follows:
                 >>>spreadsheet['B10'].select_table()
         """
-        if self.app.Range(self.start_cell).GetOffset(0, 1).Value2 is None:
-            end_column = re.findall('[A-Z]+',
-                                    self.start_cell)[0]
+        start = self._range.Cells(1)
+        if start.GetOffset(0, 1).Value2 is None:
+            end_column = start.Column
         else:
-            end_column = re.findall('[A-Z]+',
-                                    self.app.Range(self.start_cell)
-                                    .End(config.xlToRight)
-                                    .Address
-                                    .replace('$', ''))[0]
-        if self.app.Range(self.start_cell).GetOffset(1, 0).Value2 is None:
-            end_index = re.findall('[0-9]+',
-                                    self.start_cell)[0]
+            end_column = start.End(xlToRight).Column
+        if start.GetOffset(1, 0).Value2 is None:
+            end_row = start.Row
         else:
-            end_index = re.findall('[0-9]+',
-                                   self.app.Range(self.start_cell)
-                                   .End(config.xlDown)
-                                   .Address
-                                   .replace('$', ''))[0]
-        end_cell = ''.join([end_column,end_index])
-        self._range = self.app.Range(':'.join([self.start_cell,
-                                               end_cell]))
+            end_row = start.End(xlDown).Row
+        worksheet = self.sheet
+        self._set_range(worksheet.Range(start, worksheet.Cells(end_row, end_column)))
         return self
 
     def to_dataframe(self, header: bool=False, index: bool=False):
@@ -224,30 +271,62 @@ class Range():
         Returns:
             A pandas DataFrame.
         """
-        if self.values:
-            dataframe = pd.DataFrame(list(self.values))
+        import pandas as pd
+
+        values = self.values
+        if values:
             if header:
-                dataframe.columns = dataframe.iloc[0]
-                dataframe = dataframe.iloc[1:]
+                # Rows keep their position in the range, so the index starts at 1 after the header.
+                dataframe = pd.DataFrame.from_records(values[1:], columns=values[0],
+                                                      index=range(1, len(values)))
+            else:
+                dataframe = pd.DataFrame.from_records(values)
             if index:
                 dataframe.set_index(dataframe.columns[0],drop=True,inplace=True)
             return dataframe
         return None
 
-    def copy(self):
-        """Copies the range to clipboard."""
-        self._range.Select()
-        self._range.Copy()
+    def copy(self, destination: 'Range'=None):
+        """Copies the range to clipboard, or directly to another range.
+        Arguments:
+            destination: Range or None, the range to copy to. If None the range is copied to the
+                clipboard instead, to be pasted with paste().
+        """
+        if destination is None:
+            self._range.Copy()
+        else:
+            self._range.Copy(Destination=destination._range)
 
-    def cut(self):
-        """Copies the range to clipboard and clears the range."""
-        self._range.Select()
-        self._range.Cut()
+    def cut(self, destination: 'Range'=None):
+        """Copies the range to clipboard and clears the range, or moves it directly to another range.
+        Arguments:
+            destination: Range or None, the range to move to. If None the range is cut to the
+                clipboard instead, to be pasted with paste().
+        """
+        if destination is None:
+            self._range.Cut()
+        else:
+            self._range.Cut(Destination=destination._range)
 
     def paste(self):
         """Paste from clipboard into the range."""
-        self._range.Select()
-        self.app.ActiveSheet.Paste()
+        with fast_mode(self.app):
+            self.sheet.Paste(Destination=self._range)
+
+    def clear(self, kind: str='all'):
+        """Removes the given kind of content from the range.
+        Arguments:
+            kind: str, one of 'all', 'values', 'formatting', 'contents' or 'comments'.
+                See the clear_<kind> method of the same name for what is removed.
+        Raises:
+            ExcelError if kind is not a recognised kind of clear.
+        """
+        try:
+            method = _CLEAR_METHODS[kind]
+        except KeyError:
+            raise ExcelError(f"Can not clear '{kind}' from a range, expected one of "
+                             f"{', '.join(_CLEAR_METHODS)}.") from None
+        getattr(self, method)()
 
     def clear_all(self):
         """Removes everything from the range (both values and formatting)"""
@@ -270,21 +349,167 @@ class Range():
     def clear_comments(self):
         self._range.ClearComments()
 
-    def data_validation_from_list(self, list: list):
+    def data_validation_from_list(self, values: list):
         """Adds data validation to the range based on a list of values.
         This adds a drop down menu to the range allowing users to select a value based
-        on the contents of 'list'. This is not enforced when interacting with Microsoft
+        on the contents of 'values'. This is not enforced when interacting with Microsoft
         Excel via this package or VBA however.
+        Lists too long to be typed into the validation rule are written to a column of a
+        very hidden worksheet (see config.validation_list_sheet) and referenced from there. The
+        sheet is saved with the workbook but is left out of Workbook.sheet_names.
         Arguments:
-            list: list, the list of values allowed for this range.
+            values: list, the list of values allowed for this range.
         """
-        formula = ','.join([str(i) for i in list])
+        formula = ','.join(map(str, values))
+        if len(formula) > config.max_validation_formula:
+            formula = self._write_validation_list(values)
         self._range.Validation.Delete()
         self._range.Validation.Add(Type=3, AlertStyle=1, Operator=1, Formula1=formula)
 
+    def _write_validation_list(self, values: list) -> str:
+        """Writes values to the next empty column of the hidden validation list worksheet.
+        Returns:
+            A formula referring to the written cells, for use as a validation source.
+        """
+        workbook = self._range.Worksheet.Parent
+        try:
+            sheet = workbook.Worksheets(config.validation_list_sheet)
+        # pylint: disable=no-member
+        except pywintypes.com_error:
+            active = workbook.ActiveSheet
+            sheet = workbook.Worksheets.Add(After=workbook.Worksheets(workbook.Worksheets.Count))
+            sheet.Name = config.validation_list_sheet
+            # Very hidden sheets cannot be unhidden from the Excel interface.
+            sheet.Visible = config.xlSheetVeryHidden
+            active.Activate()
+            if self.workbook is not None:
+                self.workbook.invalidate_cache()
+        last = sheet.Cells(1, sheet.Columns.Count).End(xlToLeft)
+        column = last.Column + 1 if last.Value2 is not None else 1
+        block = sheet.Range(sheet.Cells(1, column), sheet.Cells(len(values), column))
+        block.Value2 = tuple((value,) for value in values)
+        return f"='{config.validation_list_sheet}'!{block.Address}"
+
+    def _set_range(self, com_range):
+        """Points this object at a new Excel range and drops the values cached for the old one.
+        The address and dimensions of a range are read from Excel once and then reused, since
+        each read is a cross-process COM call.
+        """
+        self._range = com_range
+        self._sheet = None
+        self._address = None
+        self._rows = None
+        self._columns = None
+
+    def _fetch_bundle(self):
+        """Reads the address of the range and derives its dimensions from it, so that address,
+        rows and columns together cost a single COM call. The dimensions are left unset (and
+        read from Excel when needed) if the address is not a single block of cells.
+        """
+        self._address = _get_property(self._range, 'Address').replace('$', '')
+        bounds = tools.address_to_bounds(self._address)
+        if bounds is not None:
+            first_row, first_column, last_row, last_column = bounds
+            self._rows = last_row - first_row + 1
+            self._columns = last_column - first_column + 1
+
+    def _reference(self) -> str:
+        """Returns the address of the range qualified by its workbook and worksheet,
+        e.g. '[Book1]Sheet1!$A$1:$B$2'. It is read from Excel on every call, since saving the
+        workbook, renaming the sheet or inserting cells above the range all change it."""
+        return self._range.GetAddress(External=True)
+
+
+@contextlib.contextmanager
+def fast_mode(application: win32com.client.CDispatch):
+    """Suspends screen updating, the status bar, events and automatic recalculation in Microsoft Excel.
+    Excel otherwise repaints and recalculates after every change made over COM, which dominates
+    the time taken by bulk operations. The previous settings are restored on exit (triggering any
+    pending recalculation), even if an exception is raised.
+    Arguments:
+        application: win32com.client.CDispatch, the Microsoft Excel application, or any Excel
+            object with an Application property (e.g. a worksheet).
+    """
+    app = application.Application
+    screen_updating = app.ScreenUpdating
+    enable_events = app.EnableEvents
+    calculation = app.Calculation
+    interrupt_key = app.CalculationInterruptKey
+    calculate_before_save = app.CalculateBeforeSave
+    display_status_bar = app.DisplayStatusBar
+    app.ScreenUpdating = False
+    app.EnableEvents = False
+    app.Calculation = config.xlCalculationManual
+    app.CalculationInterruptKey = config.xlNoKey
+    app.CalculateBeforeSave = False
+    app.DisplayStatusBar = False
+    try:
+        yield
+    finally:
+        app.DisplayStatusBar = display_status_bar
+        app.CalculateBeforeSave = calculate_before_save
+        app.CalculationInterruptKey = interrupt_key
+        app.Calculation = calculation
+        app.EnableEvents = enable_events
+        app.ScreenUpdating = screen_updating
+
+
+def _is_dataframe(value: Any) -> bool:
+    """Returns True if value is a pandas DataFrame, without importing pandas.
+    A value can only be a DataFrame if pandas has already been imported by the caller.
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(value, pd.DataFrame)
+
+
+def _is_ndarray(value: Any) -> bool:
+    """Returns True if value is a numpy array, without importing numpy (see _is_dataframe)."""
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _variant_array(values: Tuple[Tuple[Any, ...], ...]) -> win32com.client.VARIANT:
+    """Wraps rows of values as a VT_ARRAY | VT_VARIANT so that win32com builds the SAFEARRAY
+    directly, without inferring the type of the sequence it is given."""
+    return win32com.client.VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_VARIANT, values)
+
+
+def _unchanged(values: Any) -> Any:
+    """Returns values as they are."""
+    return values
+
+
+def _get_property(com_range: win32com.client.CDispatch, name: str) -> Any:
+    """Reads a property of an Excel range with a direct IDispatch::Invoke call.
+    This skips the attribute lookup and result wrapping done by the win32com proxy, which matters
+    for properties that are read often. Only use this for properties that return plain values
+    rather than other COM objects.
+    Arguments:
+        com_range: win32com.client.CDispatch, the Excel range to read from.
+        name: str, the name of the property.
+    Returns:
+        The value of the property.
+    """
+    oleobj = com_range._oleobj_
+    try:
+        dispid = _dispids[name]
+    except KeyError:
+        dispid = _dispids[name] = oleobj.GetIDsOfNames(name)
+    return oleobj.Invoke(dispid, 0, pythoncom.DISPATCH_PROPERTYGET, True)
+
+
+# The scalars and iterables values are usually passed as, each recognised with a single isinstance
+# call. Anything else (e.g. numpy arrays, generators or sets) falls through to the __iter__ check.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+_ITERABLE_TYPES = (list, tuple)
+
 
 def is_iter(value: Any) -> bool:
     """Returns True if a value is a non-str iterable."""
+    if isinstance(value, _SCALAR_TYPES):
+        return False
+    if isinstance(value, _ITERABLE_TYPES):
+        return True
     return hasattr(value, '__iter__') and not isinstance(value, str)
 
 
@@ -296,7 +521,8 @@ def format_values(values: Any, rows: int, col: int) -> Tuple[Tuple[Any, ...], ..
     This format is essentially a sequence of row values.
 
     Arguments:
-         values: values to reshape. This can be a single value, or an iterable of values.
+         values: values to reshape. This can be a single value, an iterable of values or a numpy
+            array of up to two dimensions.
          rows: int, the number of tuples in the resulting tuple.
             This should be equal to the number of rows in the range the
             values will be written to.
@@ -309,22 +535,52 @@ def format_values(values: Any, rows: int, col: int) -> Tuple[Tuple[Any, ...], ..
     Raises:
         ExcelError if the passed values are longer than the passed (rows, columns) dimensions.
     """
+    if _is_ndarray(values):
+        return tuple(map(tuple, _to_block(values, rows, col).tolist()))
+    if type(values) in _SCALAR_TYPES:
+        return _format_scalar(values, rows, col)
     if not is_iter(values):
-        values = (values,)
+        values = ((values,),)
     elif any(is_iter(v) for v in values):
-        values = tuple(v if is_iter(v) else (v,) for v in values)
+        values = [tuple(v) if is_iter(v) else (v,) for v in values]
     else:
-        values = (values,)
-    if len(values) > rows or max([len(v) if is_iter(v) else 1 for v in values]) > col:
+        values = [tuple(values)]
+    if len(values) > rows or max(map(len, values), default=0) > col:
         raise ExcelError('Dimensions of values passed exceed dimensions of range.')
-    array = np.full(shape=(rows, col), fill_value=None)
-    for i, value in enumerate(values):
-        if isinstance(value, (list, tuple)):
-            for j, v in enumerate(value):
-                array[i, j] = v
-        else:
-            array[0, i] = value
-    return tuple(map(tuple, array))
+    # Rows are padded by concatenating tuples rather than through an intermediate array.
+    none_row = (None,) * col
+    padded = [row + none_row[len(row):] for row in values]
+    padded.extend([none_row] * (rows - len(padded)))
+    return tuple(padded)
+
+
+# Only scalars are cached (see _SCALAR_TYPES): nested tuples compare equal when their elements do
+# (e.g. True == 1), so caching them could return blocks holding values of the wrong type.
+@functools.lru_cache(maxsize=256, typed=True)
+def _format_scalar(value: Any, rows: int, col: int) -> Tuple[Tuple[Any, ...], ...]:
+    """Returns the format_values block for a single value, cached by value type and dimensions."""
+    if rows < 1 or col < 1:
+        raise ExcelError('Dimensions of values passed exceed dimensions of range.')
+    none_row = (None,) * col
+    return ((value,) + none_row[1:],) + (none_row,) * (rows - 1)
+
+
+def _to_block(values: 'numpy.ndarray', rows: int, col: int) -> 'numpy.ndarray':
+    """Places a numpy array of up to two dimensions into a (rows, col) object array padded with None.
+    Raises:
+        ExcelError if the array is larger than (rows, col).
+    """
+    import numpy as np
+
+    values = np.atleast_2d(values)
+    if values.ndim > 2 or values.shape[0] > rows or values.shape[1] > col:
+        raise ExcelError('Dimensions of values passed exceed dimensions of range.')
+    if values.shape == (rows, col):
+        # Nothing to pad, e.g. a DataFrame written to a range sized from it.
+        return values.astype(object, copy=False)
+    block = np.empty(shape=(rows, col), dtype=object)
+    block[:values.shape[0], :values.shape[1]] = values
+    return block
 
 
 class ExcelError(Exception):
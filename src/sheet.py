@@ -1,10 +1,12 @@
-import re
+import os
 
 import pywintypes
 import functools
 
 from src import config
-from src.range import ExcelError
+from src.range import ExcelError, fast_mode
+
+_CSV_CODE = config.save_code('.csv')
 
 
 def run_without_protection(func):
@@ -28,14 +30,17 @@ class Sheet():
         sheet: the win32com.client.CDispatch object referring to this worksheet in Microsoft Excel.
         name: str, the name of the worksheet.
     Arguments:
-        workbook: Workbook, a workbook instance referring to the open
-            workbook that this sheet exists in.
+        current_sheet: the win32com.client.CDispatch object referring to the worksheet.
+        path: str, the path to the workbook that contains the worksheet.
         name: str or None, the name of the worksheet to access.
             If None, the active worksheet will be used.
+        workbook: Workbook or None, a workbook instance referring to the open
+            workbook that this sheet exists in.
     """
-    def __init__(self, current_sheet, path, name: str=None):
+    def __init__(self, current_sheet, path, name: str=None, workbook=None):
         self.sheet = current_sheet
         self.path = path
+        self.workbook = workbook
 
     @property
     def name(self):
@@ -46,6 +51,8 @@ class Sheet():
     def name(self, name: str):
         """Renames the worksheet."""
         self.sheet.Name = name
+        if self.workbook is not None:
+            self.workbook.invalidate_sheet_names()
 
     @property
     def protected(self):
@@ -76,21 +83,29 @@ class Sheet():
             ExcelError if the .csv fails to save.
         """
         if path is None:
-            path = self.path.replace(get_extension(self.path), '')
-        if not get_extension(path) == '.csv':
+            path = os.path.splitext(self.path)[0] + '.csv'
+        elif get_extension(path) != '.csv':
             path = path + '.csv'
         try:
-            self.sheet.SaveAs(path, config.ext_save_codes['.csv'],
-                              password, write_reserved_password, read_only_recommended)
+            with fast_mode(self.sheet):
+                self.sheet.SaveAs(path, _CSV_CODE,
+                                  password, write_reserved_password, read_only_recommended)
         # pylint: disable=no-member
         except pywintypes.com_error as com_error:
             raise ExcelError(f"Failed to save sheet {self.name} as '{path}'") from com_error
+        if self.workbook is not None:
+            # Saving a sheet as .csv renames the workbook that contains it.
+            self.workbook.invalidate_cache()
 
     def open_in_new_workbook(self):
         """Opens a new workbook that contains only a copy of the sheet."""
         self.sheet.Copy()
+        if self.workbook is not None:
+            # The new workbook becomes the active workbook.
+            self.workbook.invalidate_cache()
 
         
+@functools.lru_cache(maxsize=1024)
 def get_extension(filepath: str) -> str:
     """Returns the file extension from a filepath, the suffix delimited by (and including)
     the final fullstop.
@@ -102,6 +117,11 @@ def get_extension(filepath: str) -> str:
         The extension as a string, including the leading fullstop.
         If no suffix is found, returns None instead.
     """
-    ext = ''.join(re.findall('\.[^.]*$', str(filepath)))
-    return ext if ext else None
+    root, ext = os.path.splitext(str(filepath))
+    if not ext:
+        # splitext treats a bare extension (e.g. '.mp3') as a file name with no extension.
+        name = os.path.basename(root)
+        if name.startswith('.') and name.count('.') == 1:
+            ext = name
+    return ext or None
   
\ No newline at end of file
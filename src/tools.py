@@ -2,8 +2,10 @@
 Contains helper functions. None are related to a specific Excel object.
 """
 
+import functools
 from datetime import datetime
 from datetime import timedelta
+from typing import Optional, Tuple
 
 
 def number_to_date(number: int) -> datetime.date:
@@ -20,3 +22,65 @@ def date_to_number(date: datetime.date) -> int:
     return number
 
 
+@functools.lru_cache(maxsize=16384)
+def number_to_column(number: int) -> str:
+    """Converts a column number to its reference, e.g. 1 to 'A' and 27 to 'AA'."""
+    column = ''
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        column = chr(65 + remainder) + column
+    return column
+
+
+@functools.lru_cache(maxsize=1024)
+def cells_to_address(cells: Tuple) -> Optional[str]:
+    """Returns the address of a cell given as (row, column), or of a block of cells given as
+    ((first_row, first_column), (last_row, last_column)), e.g. ((5, 3), (13, 7)) to 'C5:G13'.
+    Returns None if any row or column is less than 1.
+    """
+    corners = cells if isinstance(cells[0], tuple) else (cells,)
+    if any(row < 1 or column < 1 for row, column in corners):
+        return None
+    return ':'.join(number_to_column(column) + str(row) for row, column in corners)
+
+
+def address_to_bounds(address: str) -> Optional[Tuple[int, int, int, int]]:
+    """Returns the first row, first column, last row and last column of a range address.
+
+    Arguments:
+        address: str, a range address without $ as returned by Range.address, e.g. 'B2:D10'.
+
+    Returns:
+        A tuple of four ints, or None if the address is not a single block of cells
+        (e.g. multi-area ranges or whole rows and columns such as 'A:A').
+    """
+    corners = address.split(':')
+    if len(corners) > 2:
+        return None
+    first = _parse_cell(corners[0])
+    last = _parse_cell(corners[-1]) if len(corners) == 2 else first
+    if first is None or last is None:
+        return None
+    return first + last
+
+
+def _parse_cell(cell: str) -> Optional[Tuple[int, int]]:
+    """Returns the (row, column) of a cell reference such as 'AA10', or None if it is not one.
+    The column letters and then the row digits are read in a single forward pass.
+    """
+    column = 0
+    index = 0
+    for char in cell:
+        if not 'A' <= char <= 'Z':
+            break
+        column = column * 26 + ord(char) - 64
+        index += 1
+    row = 0
+    for char in cell[index:]:
+        if not '0' <= char <= '9':
+            return None
+        row = row * 10 + ord(char) - 48
+    if not column or not row:
+        return None
+    return row, column
+
@@ -0,0 +1,24 @@
+import numpy as np
+
+
+def assert_range_equal(a, b):
+    """Asserts that two sets of range values (e.g. the tuple of tuples returned by Range.values) are equal."""
+    assert np.array_equal(np.asarray(a, dtype=object), np.asarray(b, dtype=object))
+
+
+def assert_all_none(values):
+    """Asserts that every cell in a set of range values is empty."""
+    assert np.all(np.asarray(values, dtype=object) == None)  # noqa: E711, elementwise comparison
+
+
+def batch_read(obj, names):
+    """Reads several attributes of an object, e.g. the properties of a Range, into a dict
+    mapping each name to its value."""
+    return {name: getattr(obj, name) for name in names}
+
+
+def batch_write(obj, values):
+    """Sets several attributes of an object, e.g. the properties of a Range, from a mapping of
+    attribute names to values, in order."""
+    for name, value in values.items():
+        setattr(obj, name, value)
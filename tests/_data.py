@@ -0,0 +1,6 @@
+import numpy as np
+
+
+def mat(values):
+    """Returns values as a 2D object array, which Range.values writes to Excel as a single VARIANT array."""
+    return np.asarray(values, dtype=object)
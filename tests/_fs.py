@@ -0,0 +1,14 @@
+import os
+
+
+def dir_contains(path, *names):
+    """Returns True if the directory at path contains a file with each of the given names.
+    The directory is scanned once, stopping as soon as every name has been found.
+    """
+    missing = set(names)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            missing.discard(entry.name)
+            if not missing:
+                return True
+    return not missing
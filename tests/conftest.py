@@ -1,24 +1,117 @@
+import dataclasses
 import pytest
 import os
 import shutil
-from src.main import Workbook
+import src
+from tests import testcases
+from tests._assert_helpers import batch_write
 
 WB_NUMBER = 0
 
-@pytest.fixture(scope='class')
+
+def pytest_generate_tests(metafunc):
+    """Parametrizes 'testcase' with the cases named by a test's testcases marker."""
+    marker = metafunc.definition.get_closest_marker('testcases')
+    if marker is not None:
+        metafunc.parametrize('testcase', getattr(testcases, marker.args[0])(), indirect=True)
+
+@pytest.fixture
+def testcase(request):
+    """Returns the parametrized test case, building any values that were deferred as callables."""
+    case = request.param
+    if callable(case.values):
+        case = dataclasses.replace(case, values=case.values())
+    return case
+
+
+@pytest.fixture(scope='session')
+def excel_app():
+    """Starts a dedicated Microsoft Excel process for the test session and shares it with every
+    Workbook opened by the tests. Only started for tests that need Excel, through the workbook
+    fixtures or by requesting it directly. Screen updating stays off for the whole session.
+    Under pytest-xdist (e.g. pytest -n auto --dist=loadfile) each worker is a separate process
+    with its own session, so workers never share an Excel instance."""
+    import src.main
+
+    app = src.main.dispatch_excel(new_instance=True)
+    app.Visible = False
+    app.DisplayAlerts = False
+    app.ScreenUpdating = False
+    src.main.Workbook._shared.app = app
+    yield app
+    src.main.Workbook._shared.app = None
+    app.Quit()
+
+
+@pytest.fixture
+def fast_excel(excel_app):
+    """Keeps Excel in fast_mode (manual calculation, no events or repainting) for a single test.
+    Only for write-heavy tests that do not depend on formulas recalculating or on events."""
+    from src.range import fast_mode
+
+    with fast_mode(excel_app):
+        yield excel_app
+
+
+@pytest.fixture(scope='module')
 def testdir(tmp_path_factory):
     testdir = tmp_path_factory.mktemp('tests')
     yield testdir
     shutil.rmtree(testdir)
 
-@pytest.fixture(scope='class')
-def open_workbook(testdir):
-    with Workbook(testdir.joinpath('test')) as wb:
+@pytest.fixture(scope='module')
+def open_workbook(testdir, excel_app):
+    """A workbook shared by the tests of a module."""
+    with src.Workbook(testdir.joinpath('test')) as wb:
         yield wb
 
-@pytest.fixture(scope='function')
-def unique_workbook(testdir):
+@pytest.fixture(autouse=True)
+def reset_open_workbook(request):
+    """Resets the module's open_workbook before each test that uses it, which is much faster than
+    opening a new workbook for every test."""
+    if 'open_workbook' in request.fixturenames:
+        reset_workbook(request.getfixturevalue('open_workbook'))
+
+def reset_workbook(wb):
+    """Returns a workbook to the state of a new workbook: active, with a single empty sheet named
+    'Sheet1' and no named ranges. Any other workbooks open in the application are closed."""
+    for other in list(wb.app.Application.Workbooks):
+        if other.Name != wb.workbook.Name:
+            other.Close(False)
+    wb.workbook.Activate()
+    worksheets = wb.workbook.Worksheets
+    while worksheets.Count > 1:
+        worksheets(worksheets.Count).Delete()
+    sheet = worksheets(1)
+    sheet.Unprotect()
+    sheet.Name = 'Sheet1'
+    sheet.Activate()
+    sheet.Cells.Clear()
+    sheet.Cells.Validation.Delete()
+    for name in list(wb.workbook.Names):
+        name.Delete()
+    wb.invalidate_cache()
+
+def _new_workbook(testdir):
+    """Opens a new workbook saved to its own file in testdir, closing it when the generator finishes."""
     global WB_NUMBER
-    with Workbook(testdir.joinpath(f"test{WB_NUMBER}")) as wb:
+    with src.Workbook(testdir.joinpath(f"test{WB_NUMBER}")) as wb:
         yield wb
-    WB_NUMBER += 1
\ No newline at end of file
+    WB_NUMBER += 1
+
+@pytest.fixture(scope='function')
+def unique_workbook(testdir, excel_app):
+    """A new workbook, saved to its own file, for a single test."""
+    yield from _new_workbook(testdir)
+
+@pytest.fixture(scope='module')
+def shared_unique_workbook(testdir, excel_app):
+    """A workbook saved to its own file and shared by the tests of a module that opt into it.
+    Only for tests that leave the workbook's path unchanged."""
+    yield from _new_workbook(testdir)
+
+@pytest.fixture(scope='function')
+def populated_range(open_workbook):
+    range = open_workbook['A1:C3']
+    batch_write(range, testcases.populated_range_properties)
+    return range
@@ -1,54 +1,96 @@
+import pickle
+
+import numpy as np
 import src.range
+import src.config
 import src.tools
 from tests import testcases
-import src.main as xl
+from tests._assert_helpers import assert_all_none, batch_read
+from tests._data import mat
 import pytest
 
+pd = pytest.importorskip('pandas')
+
+# The values read back from an empty 3x3 range.
+_NONE_3x3 = ((None, None, None),) * 3
+
 
-@pytest.mark.parametrize('testcase', testcases.padded_tuple_tests)
+@pytest.mark.testcases('padded_tuple_tests')
 def test_padded_tuple(testcase):
     assert src.range.format_values(testcase.values, testcase.x, testcase.y) == testcase.expected
 
 
+def test_format_values_array():
+    """Tests that arrays which already fit the range are passed through, and smaller ones are padded."""
+    values = np.array([[1, 2], [3, 4]])
+    assert src.range.format_values(values, 2, 2) == ((1, 2), (3, 4))
+    assert src.range.format_values(values, 3, 3) == ((1, 2, None), (3, 4, None), (None, None, None))
+    with pytest.raises(src.range.ExcelError):
+        src.range.format_values(values, 1, 2)
+
+
+def test_testcases_pickle():
+    """Tests that the test cases survive a pickle round trip, as pytest-xdist may serialise them."""
+    cases = testcases.padded_tuple_tests() + [case for case in testcases.range_tests() if not callable(case.values)]
+    for case in cases:
+        assert pickle.loads(pickle.dumps(case)) == case
+
+
+@pytest.mark.parametrize(['address', 'bounds'], [('A1', (1, 1, 1, 1)), ('C5:G13', (5, 3, 13, 7)),
+                                                 ('Z1:AA1', (1, 26, 1, 27)), ('A:A', None),
+                                                 ('A1:B2,D4', None)])
+def test_address_to_bounds(address, bounds):
+    assert src.tools.address_to_bounds(address) == bounds
+
+
+@pytest.mark.parametrize(['cells', 'address'], [((1, 1), 'A1'), (((5, 3), (13, 7)), 'C5:G13'),
+                                                (((1, 26), (1, 27)), 'Z1:AA1'),
+                                                (((1, 27), (100, 702)), 'AA1:ZZ100'), ((0, 1), None)])
+def test_cells_to_address(cells, address):
+    assert src.tools.cells_to_address(cells) == address
+
+
 class TestRange:
-    @pytest.mark.parametrize('testcase', testcases.range_tests)
+    @pytest.mark.usefixtures('fast_excel')
+    @pytest.mark.testcases('range_tests')
     def test_values(self, open_workbook, testcase):
         """Test that Range.values setter works for a range of different inputs and ranges."""
         open_workbook[testcase.range] = testcase.values
         assert open_workbook[testcase.range].values == testcase.expected_values
 
-    @pytest.mark.parametrize('testcase', testcases.range_tests_fail)
+    @pytest.mark.usefixtures('fast_excel')
+    @pytest.mark.testcases('range_tests_fail')
     def test_values_fail(self, open_workbook, testcase):
         """Test that Range.values setter raises the correct exception when expected to fail."""
         with pytest.raises(src.range.ExcelError):
             open_workbook[testcase.range] = testcase.values
 
+    def test_values_dataframe_resizes_range(self, open_workbook):
+        """Test that writing a DataFrame fills a range of exactly its shape from the first cell."""
+        open_workbook['B2'] = pd.DataFrame([[1, 2], [3, 4]])
+        assert open_workbook['B2:D4'].values == ((1, 2, None), (3, 4, None), (None, None, None))
+
     def test_name(self, open_workbook):
         """Tests named range functionality."""
         assert open_workbook['A1:Z10'].name is None
         open_workbook['A1:Z10'].name = 'name'
         assert open_workbook['A1:Z10'].name == 'name'
 
-    @pytest.mark.parametrize(['range', 'dim'], [('A1', (1, 1)), ('C5:G13', (5, 9)), ('Z1:AA1', (2, 1)),
-                                                ((1, 1), (1, 1)), (((5, 3), (13, 7)), (5, 9)),
-                                                (((1, 26), (1, 27)), (2, 1))])
-    def test_dim(self, open_workbook, range, dim):
-        """Test that the .dim attribute returns the correct dimensions."""
-        assert open_workbook[range].dim == dim
-
-    @pytest.mark.parametrize(['range', 'expected'], [('A1', 'A1'), ('C5:G13', 'C5'), ('AA1:ZZ100', 'AA1'),
-                                                     ((1, 1), 'A1'), (((5, 3), (13, 7)), 'C5'),
-                                                     (((1, 27), (100, 52)), 'AA1')])
-    def test_start_cell(self, open_workbook, range, expected):
-        """Test that the start_cell attribute returns the expected cell name."""
-        assert open_workbook[range].start_cell == expected
-
-    @pytest.mark.parametrize(['range', 'expected'], [('A1', 'A1'), ('C5:G13', 'C5:G13'), ('AA1:ZZ100', 'AA1:ZZ100'),
-                                                     ((1, 1), 'A1'), (((5, 3), (13, 7)), 'C5:G13'),
-                                                     (((1, 27), (100, 702)), 'AA1:ZZ100')])
-    def test_address(self, open_workbook, range, expected):
-        """Test that the .address attribute returns the cell range as a string."""
-        assert open_workbook[range].address == expected
+    @pytest.mark.parametrize(['range', 'dim', 'start_cell', 'address'], [
+        ('A1', (1, 1), 'A1', 'A1'),
+        ('C5:G13', (5, 9), 'C5', 'C5:G13'),
+        ('Z1:AA1', (2, 1), 'Z1', 'Z1:AA1'),
+        ('AA1:ZZ100', (676, 100), 'AA1', 'AA1:ZZ100'),
+        ((1, 1), (1, 1), 'A1', 'A1'),
+        (((5, 3), (13, 7)), (5, 9), 'C5', 'C5:G13'),
+        (((1, 26), (1, 27)), (2, 1), 'Z1', 'Z1:AA1'),
+        (((1, 27), (100, 52)), (26, 100), 'AA1', 'AA1:AZ100'),
+        (((1, 27), (100, 702)), (676, 100), 'AA1', 'AA1:ZZ100'),
+    ])
+    def test_geometry(self, open_workbook, range, dim, start_cell, address):
+        """Test that the .dim, .start_cell and .address attributes describe the referenced cells."""
+        range = open_workbook[range]
+        assert (range.dim, range.start_cell, range.address) == (dim, start_cell, address)
 
     def test_number_format(self, open_workbook):
         """Test that number format can be applied with a string code."""
@@ -57,17 +99,24 @@ class TestRange:
         open_workbook['A1:Z10'].number_format = test_format_code
         assert open_workbook['A1:Z10'].number_format == test_format_code
 
+    @pytest.mark.usefixtures('fast_excel')
     def test_select_table(self, open_workbook):
         """Test that select_table method selects a continuous range of non-empty cells."""
-        open_workbook['A1:C3'] = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
+        open_workbook['A1:C3'] = mat(((1, 2, 3), (4, 5, 6), (7, 8, 9)))
         assert open_workbook['A1'].select_table() == open_workbook['A1:C3']
         assert not open_workbook['B1'].select_table() == open_workbook['A1:C3']
         assert not open_workbook['A2'].select_table() == open_workbook['A1:C3']
 
+    def test_equality_after_rename(self, unique_workbook):
+        """Test that ranges still compare equal after their sheet is renamed."""
+        before = unique_workbook['A1']
+        assert before == unique_workbook['A1']
+        unique_workbook.active_sheet.name = 'Renamed'
+        assert before == unique_workbook['A1']
+
     def test_to_dataframe(self, open_workbook):
         """Test that to_dataframe returns a pandas dataframe of the correct dimensions."""
-        import pandas as pd
-        open_workbook['A1:C3'] = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
+        open_workbook['A1:C3'] = mat(((1, 2, 3), (4, 5, 6), (7, 8, 9)))
         df = open_workbook['A1:C3'].to_dataframe()
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 3
@@ -75,11 +124,19 @@ class TestRange:
 
     def test_to_dataframe_header_and_index(self, open_workbook):
         """Test to_dataframe with header and index parameters."""
-        open_workbook['A1:C3'] = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
+        open_workbook['A1:C3'] = mat(((1, 2, 3), (4, 5, 6), (7, 8, 9)))
         df = open_workbook['A1:C3'].to_dataframe(header=True, index=True)
         assert list(df.columns) == [2, 3]
         assert list(df.index) == [4, 7]
 
+    def test_to_dataframe_header_keeps_row_numbers(self, open_workbook):
+        """Test that with a header the index counts rows from 1, skipping the header row."""
+        open_workbook['A1:B3'] = mat((('a', 'b'), (1, 2), (3, 4)))
+        df = open_workbook['A1:B3'].to_dataframe(header=True)
+        assert list(df.columns) == ['a', 'b']
+        assert list(df.index) == [1, 2]
+        assert all(dtype.kind == 'f' for dtype in df.dtypes)
+
     def test_comment(self, open_workbook):
         """Test that comments can be added and removed from ranges."""
         assert open_workbook['A1:B2'].comment is None
@@ -88,50 +145,55 @@ class TestRange:
         open_workbook['A1:B2'].comment = None
         assert open_workbook['A1:B2'].comment is None
 
-    def test_clear_formats(self, open_workbook):
-        """Test that the clear method works with formats."""
-        range = open_workbook['A1:C3']
-        values = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
-        range.values = values
-        range.number_format = '#,###.00_);[Red](#,###.00);0.00;"gross receipts for"@'
-        range.clear_formatting()
-        assert range.number_format == 'General'
-        assert range.values == values
-
-    def test_clear_comments(self, open_workbook):
-        """Test that the clear method works with comments."""
-        range = open_workbook['A1:C3']
-        values = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
-        range.values = values
-        range.comment = 'clear this!'
-        range.clear_comments()
-        assert range.comment is None
-        assert range.values == values
-
-    def test_clear_contents(self, open_workbook):
-        """Test that the clear method works with contents."""
-        range = open_workbook['A1:C3']
-        values = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
-        range.values = values
-        range.comment = "don't clear this!"
-        range.clear_contents()
-        assert range.comment == "don't clear this!"
-        assert all(v is None for t in range.values for v in t)
-
-    def test_clear_all(self, open_workbook):
-        """Test that the clear method works when clearing all contents."""
-        range = open_workbook['A1:C3']
-        values = ((1, 2, 3), (4, 5, 6), (7, 8, 9))
-        range.values = values
-        range.comment = "don't clear this!"
-        range.number_format = '#,###.00_);[Red](#,###.00);0.00;"gross receipts for"@'
-        range.clear_all()
-        assert range.comment is None
-        assert range.number_format == 'General'
-        assert all(v is None for t in range.values for v in t)
+    @pytest.mark.usefixtures('fast_excel')
+    @pytest.mark.parametrize(['method', 'expected'], [
+        ('clear_formatting', {'number_format': 'General',
+                              'values': testcases.populated_range_properties['values']}),
+        ('clear_comments', {'comment': None, 'values': testcases.populated_range_properties['values']}),
+        ('clear_contents', {'comment': testcases.populated_range_properties['comment'], 'values': _NONE_3x3}),
+        ('clear_all', {'comment': None, 'number_format': 'General', 'values': _NONE_3x3}),
+    ])
+    def test_clear_methods(self, populated_range, method, expected):
+        """Test that each clear method removes only what it should from a populated range."""
+        getattr(populated_range, method)()
+        assert batch_read(populated_range, expected) == expected
 
     def test_data_validation_from_list(self, open_workbook):
         """Tests that data_validation_from_list adds validation to a range."""
         assert not open_workbook['A1:B2'].has_data_validation
         open_workbook['A1:B2'].data_validation_from_list([1, 2, 3])
         assert open_workbook['A1'].has_data_validation
+
+    @pytest.mark.usefixtures('fast_excel')
+    def test_clear(self, open_workbook):
+        """Test that clear dispatches on kind and rejects unknown kinds."""
+        range = open_workbook['A1:C3']
+        values = testcases.populated_range_properties['values']
+        range.values = values
+        range.comment = 'clear this!'
+        range.clear('comments')
+        assert range.comment is None
+        assert range.values == values
+        range.clear()
+        assert range.values == _NONE_3x3
+        with pytest.raises(src.range.ExcelError):
+            range.clear('everything')
+
+    def test_data_validation_from_long_list(self, open_workbook):
+        """Tests that lists too long for a validation formula are referenced from a hidden sheet."""
+        values = [f'value {i}' for i in range(100)]
+        open_workbook['C1:C2'].data_validation_from_list(values)
+        assert open_workbook['C1'].has_data_validation
+        assert open_workbook.workbook.Worksheets(src.config.validation_list_sheet).Visible == \
+            src.config.xlSheetVeryHidden
+        assert src.config.validation_list_sheet not in open_workbook.sheet_names
+
+    def test_copy_to_destination(self, open_workbook):
+        """Tests that copy and cut can write straight to a destination range."""
+        values = ((1, 2), (3, 4))
+        open_workbook['A1:B2'] = values
+        open_workbook['A1:B2'].copy(open_workbook['D1'])
+        assert open_workbook['D1:E2'].values == values
+        open_workbook['D1:E2'].cut(open_workbook['G1'])
+        assert open_workbook['G1:H2'].values == values
+        assert_all_none(open_workbook['D1:E2'].values)
@@ -1,5 +1,7 @@
 import os
 
+from tests._fs import dir_contains
+
 
 class TestSheet:
     def test_name(self, open_workbook):
@@ -10,22 +12,24 @@ class TestSheet:
         assert sheet.name == 'new_name'
         assert open_workbook.workbook.ActiveSheet.Name == 'new_name'
 
-    def test_to_csv(self, open_workbook):
+    def test_to_csv(self, unique_workbook):
         """Tests the .to_csv method creates a .csv.
 
         The .csv file should be created in the same directory as the workbook if a path is not provided.
+        Saving as .csv changes the workbook's name and format, so this runs on its own workbook.
         """
-        open_workbook.active_sheet.to_csv()
-        assert 'test.csv' in os.listdir(open_workbook.dir)
+        csv_name = os.path.splitext(unique_workbook.name)[0] + '.csv'
+        unique_workbook.active_sheet.to_csv()
+        assert dir_contains(unique_workbook.dir, csv_name)
 
-    def test_open_in_new_workbook(self, open_workbook):
+    def test_open_in_new_workbook(self, unique_workbook):
         """Tests the .open_in_new_workbook method.
 
         Tests that the .open_in_new_workbook method creates a new workbook with a single sheet of the same name
         as the Sheet object.
         """
-        original_workbook = open_workbook.name
-        sheet_name = open_workbook.active_sheet.name
-        open_workbook.active_sheet.open_in_new_workbook()
-        assert open_workbook.name != original_workbook
-        assert open_workbook.sheet_names == [sheet_name]
+        original_workbook = unique_workbook.name
+        sheet_name = unique_workbook.active_sheet.name
+        unique_workbook.active_sheet.open_in_new_workbook()
+        assert unique_workbook.name != original_workbook
+        assert unique_workbook.sheet_names == [sheet_name]
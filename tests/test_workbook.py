@@ -1,9 +1,7 @@
-import src.main
-import src.main as xl
-import src.range
-import src.sheet
-import src.tools
+from src.main import Workbook, Range, Sheet, ExcelError, df2excel, read_many, _values_to_dataframe
 from src import config
+from tests._assert_helpers import assert_range_equal
+from tests._fs import dir_contains
 import pytest
 import os
 
@@ -14,17 +12,17 @@ class TestBasicMethods:
     The methods and attributes tested under this class are those which do not require any content in the workbook
     under control, for example saving, viewing sheets, etc.
     """
-    def test_open_new(self, testdir):
+    def test_open_new(self, testdir, excel_app):
         """Tests that open and close methods work on a new workbook."""
-        wb = xl.Workbook(testdir.joinpath('test.xlsx'))
+        wb = Workbook(testdir.joinpath('test.xlsx'))
         wb.close()
-        wb = xl.Workbook(testdir.joinpath('test'))
+        wb = Workbook(testdir.joinpath('test'))
         wb.close()
 
     @pytest.mark.parametrize('filename', ['fail.mp3', 'fail.doc'])
     def test_open_fails(self, testdir, filename):
-        with pytest.raises(src.range.ExcelError):
-            wb = xl.Workbook(testdir.joinpath(filename))
+        with pytest.raises(ExcelError):
+            wb = Workbook(testdir.joinpath(filename))
 
     def test_path_attrs(self, open_workbook):
         """Tests attributes related to the file path.
@@ -71,18 +69,23 @@ class TestBasicMethods:
         """Tests that the save_as method works for all supported file formats."""
         path = os.path.join(unique_workbook.dir, f"format_test{ext}")
         unique_workbook.save_as(path)
+        assert os.path.exists(path)
 
-    def test_save_copy_as(self, unique_workbook):
+    def test_save_copy_as(self, shared_unique_workbook):
         """Tests the save_copy_as method.
 
         Checks that a copy is saved without changing the reference of the open workbook, and that both files exist after
         save_copy_as is called.
         """
-        copy_path = os.path.join(unique_workbook.dir, f"copy_of_{unique_workbook.name}")
-        unique_workbook.save_copy_as(copy_path)
-        files = os.listdir(unique_workbook.dir)
-        assert unique_workbook.name != os.path.basename(copy_path)
-        assert unique_workbook.name in files and os.path.basename(copy_path) in files
+        copy_path = os.path.join(shared_unique_workbook.dir, f"copy_of_{shared_unique_workbook.name}")
+        shared_unique_workbook.save_copy_as(copy_path)
+        assert shared_unique_workbook.name != os.path.basename(copy_path)
+        assert dir_contains(shared_unique_workbook.dir, shared_unique_workbook.name, os.path.basename(copy_path))
+
+    def test_save_copy_as_fails(self, shared_unique_workbook):
+        """Tests that save_copy_as rejects file types that Microsoft Excel does not support."""
+        with pytest.raises(ExcelError):
+            shared_unique_workbook.save_copy_as(os.path.join(shared_unique_workbook.dir, 'x.mp3'))
 
     def test_getitem(self, open_workbook):
         """Tests the __getitem__ magic method.
@@ -90,11 +93,11 @@ class TestBasicMethods:
         Check that __getitem__ returns a Range object and raises an ExcelError when given a range outside of excel's
         limit; 1,048,576 rows and 16,384 columns (the maximum column is XFD).
         """
-        assert isinstance(open_workbook['A1'], src.range.Range)
-        assert isinstance(open_workbook['A1:Z100'], src.range.Range)
-        with pytest.raises(src.range.ExcelError):
+        assert isinstance(open_workbook['A1'], Range)
+        assert isinstance(open_workbook['A1:Z100'], Range)
+        with pytest.raises(ExcelError):
             assert open_workbook['A1:Z1048577']
-        with pytest.raises(src.range.ExcelError):
+        with pytest.raises(ExcelError):
             assert open_workbook['A1:XFE1']
 
     def test_setitem(self, open_workbook):
@@ -116,19 +119,36 @@ class TestBasicMethods:
         old_values = open_workbook['A1:C1'].values
         open_workbook['A1:C1'] = 'New Value'
         assert (old_values[0][0] != open_workbook['A1:C1'].values[0][0])
-        assert all(v1 == v2 for v1, v2 in zip(old_values[0][1:], open_workbook['A1:C1'].values[0][1:]))
+        assert_range_equal(old_values[0][1:], open_workbook['A1:C1'].values[0][1:])
         open_workbook['A1:F1'] = old_values
-        assert all(v1 == v2 for v1, v2 in zip(old_values[0], open_workbook['A1:F1'].values[0]))
+        assert_range_equal(old_values[0], open_workbook['A1:F1'].values[0][:len(old_values[0])])
+
+    def test_write_block(self, open_workbook):
+        """Tests that write_block sizes the block to the matrix, including DataFrames, and rejects rows that are
+        not sequences and matrices without values.
+        """
+        pd = pytest.importorskip('pandas')
+        block = open_workbook.write_block('B2', pd.DataFrame([[1, 2], [3, 4]]))
+        assert block.address == 'B2:C3'
+        with pytest.raises(ExcelError):
+            open_workbook.write_block('A1', ['abc', 'def'])
+        with pytest.raises(ExcelError):
+            open_workbook.write_block('A1', [[], []])
+        with pytest.raises(ExcelError):
+            open_workbook.write_block('A1', [])
 
     def test_active_sheet(self, open_workbook):
         """Test that the sheet attribute returns a Sheet object referencing the current active sheet."""
-        assert isinstance(open_workbook.active_sheet, src.sheet.Sheet)
+        assert isinstance(open_workbook.active_sheet, Sheet)
         assert open_workbook.active_sheet.name == open_workbook.workbook.ActiveSheet.Name
 
     def test_sheet_exists(self, open_workbook):
         """Test the sheet_exists method."""
         assert open_workbook.sheet_exists('Sheet1')
         assert not open_workbook.sheet_exists('Sheet that doesnt exist')
+        assert open_workbook.sheet_exists('sheet1')
+        with pytest.raises(ExcelError):
+            open_workbook.sheet_exists(1)
 
     def test_add_sheet(self, open_workbook):
         """Test that add sheet works correctly and raises the appropriate exception when a sheet already exists."""
@@ -138,5 +158,42 @@ class TestBasicMethods:
         assert open_workbook.sheet_names == ['NewSheet2', 'Sheet1', 'NewSheet1']
         open_workbook.add_sheet('NewSheet3', after='Sheet1')
         assert open_workbook.sheet_names == ['NewSheet2', 'Sheet1', 'NewSheet3', 'NewSheet1']
-        with pytest.raises(src.range.ExcelError):
+        with pytest.raises(ExcelError):
             open_workbook.add_sheet('NewSheet1')
+
+    def test_add_sheets(self, open_workbook):
+        """Test that add_sheets creates all sheets in order and rejects existing or repeated names."""
+        existing = open_workbook.sheet_names
+        sheets = open_workbook.add_sheets(['Batch1', 'Batch2', 'Batch3'])
+        assert open_workbook.sheet_names == existing + ['Batch1', 'Batch2', 'Batch3']
+        assert [sheet.name for sheet in sheets] == ['Batch1', 'Batch2', 'Batch3']
+        with pytest.raises(ExcelError):
+            open_workbook.add_sheets(['Batch4', 'Batch1'])
+        with pytest.raises(ExcelError):
+            open_workbook.add_sheets(['Batch5', 'batch5'])
+        with pytest.raises(ExcelError):
+            open_workbook.add_sheets(['Batch6', 7])
+
+
+def test_df2excel(testdir):
+    """Tests that df2excel writes .xlsx files and rejects other file types."""
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('xlsxwriter')
+    path = testdir.joinpath('df2excel.xlsx')
+    df2excel(pd.DataFrame({'a': [1, 2], 'b': [3, 4]}), str(path))
+    assert os.path.exists(path)
+    with pytest.raises(ExcelError):
+        df2excel(pd.DataFrame(), str(testdir.joinpath('df2excel.csv')))
+
+
+def test_read_many_no_files():
+    """Tests that read_many returns an empty list without starting Microsoft Excel when given no files."""
+    assert read_many([]) == []
+
+
+def test_values_to_dataframe_infers_int():
+    """Tests that whole-number float columns from Value2 become int64, as pandas.read_csv infers them."""
+    pytest.importorskip('pandas')
+    df = _values_to_dataframe((('a', 'b', 'c'), (1.0, 1.5, 'x'), (2.0, 2.0, None)))
+    assert [dtype.kind for dtype in df.dtypes] == ['i', 'f', 'O']
+    assert list(df.index) == [0, 1]
@@ -1,9 +1,50 @@
-from collections import namedtuple
-import pandas as pd
+import functools
+from dataclasses import dataclass
+from typing import Any
 
+# The test cases are built once, when the first test using them is collected. Tests are parametrized
+# with them through the 'testcases' marker (see conftest.py). DataFrame values are stored as callables
+# and only built when a test using them runs, so collecting the tests does not import pandas.
 
-PaddedTupleTestCase = namedtuple('PaddedTupleTestCase', ('values','x', 'y', 'expected'))
-padded_tuple_tests = [
+def _pd_df(data):
+    """Builds a DataFrame from a list of rows, going through an ndarray to avoid pandas' slower
+    list-of-lists constructor."""
+    import numpy as np
+    import pandas as pd
+
+    return pd.DataFrame(np.asarray(data, dtype=np.int64))
+
+
+def _lazy_df(data):
+    return functools.partial(_pd_df, data)
+
+
+class _FrozenSlots:
+    """Pickle support for the frozen test case dataclasses below. They declare __slots__ themselves, as
+    dataclass(slots=True) needs Python 3.10, so no __setstate__ is generated and unpickling would
+    otherwise fail on the frozen __setattr__."""
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class PaddedTupleTestCase(_FrozenSlots):
+    __slots__ = ('values', 'x', 'y', 'expected')
+    values: Any
+    x: int
+    y: int
+    expected: Any
+
+
+@functools.lru_cache(maxsize=1)
+def padded_tuple_tests():
+    return [
                 PaddedTupleTestCase('value', 1, 1, (('value',),)),
                 PaddedTupleTestCase('value', 1, 2, (('value', None),)),
                 PaddedTupleTestCase('value', 2, 1, (('value',), (None,))),
@@ -13,27 +54,45 @@ padded_tuple_tests = [
                 PaddedTupleTestCase((('a', 'b'), ('c',), ('d', 'e')), 3, 2, (('a', 'b'), ('c', None), ('d', 'e'))),
                 PaddedTupleTestCase((('a', 'b'), 'c', ('d', 'e')), 3, 2, (('a', 'b'), ('c', None), ('d', 'e'))),
                 PaddedTupleTestCase((('a', 'b'), ('c',)), 3, 2, (('a', 'b'), ('c', None), (None, None))),
+    ]
 
-]
+@dataclass(frozen=True)
+class RangeTestCase(_FrozenSlots):
+    __slots__ = ('range', 'values', 'expected_values')
+    range: Any
+    values: Any
+    expected_values: Any
 
-RangeTestCase = namedtuple('RangeTestCase', ('range', 'values', 'expected_values'))
-range_tests = [
+
+@functools.lru_cache(maxsize=1)
+def range_tests():
+    return [
                 RangeTestCase('A1', 'Test', 'Test'),
                 RangeTestCase('A1', 1, 1),
                 RangeTestCase('A1', True, True),
-                RangeTestCase('A1', pd.DataFrame([[1]]), 1),
+                RangeTestCase('A1', _lazy_df([[1]]), 1),
                 RangeTestCase('A1:C1', [1,2,3], ((1,2,3),)),
                 RangeTestCase('A1:B2', [[1,2],[3,4]], ((1,2),(3,4))),
                 RangeTestCase('A1:C2', [[1,2],1], ((1,2,None),(1, None, None))),
                 RangeTestCase('A1:B3', [[1, 2], 1], ((1, 2), (1, None), (None, None))),
-                RangeTestCase('A1:B2', pd.DataFrame([[1,2], [3,4]]), ((1,2),(3,4))),
+                RangeTestCase('A1:B2', _lazy_df([[1,2], [3,4]]), ((1,2),(3,4))),
                 RangeTestCase('A1:B2', 1, ((1,None),(None,None))),
-                ]
+    ]
+
 
-range_tests_fail = [
+@functools.lru_cache(maxsize=1)
+def range_tests_fail():
+    return [
                 RangeTestCase('A1', [1,2], None),
                 RangeTestCase('A1:B2', [[1, 2], [3, 4], [5, 6]], None),
                 RangeTestCase('A1:B2', [[1, 2, 3], [4, 5, 6]], None),
-                RangeTestCase('A1:B2', pd.DataFrame([[1, 2], [3, 4], [5, 6]]), None),
-                RangeTestCase('A1:B2', pd.DataFrame([[1, 2, 3], [4, 5, 6]]), None),
-                ]
\ No newline at end of file
+                RangeTestCase('A1:B2', _lazy_df([[1, 2], [3, 4], [5, 6]]), None),
+                RangeTestCase('A1:B2', _lazy_df([[1, 2, 3], [4, 5, 6]]), None),
+    ]
+
+# The properties set on the populated_range fixture before each clear test.
+populated_range_properties = {
+                'values': ((1, 2, 3), (4, 5, 6), (7, 8, 9)),
+                'number_format': '#,###.00_);[Red](#,###.00);0.00;"gross receipts for"@',
+                'comment': 'comment',
+                }